@@ -162,6 +162,28 @@ class Solver:
             res += Solver.solve_path(final.parent)
         return res + str(final) + "\n\n"
 
+    @staticmethod
+    def solve_moves(final):
+        """Iterate the moves from the root to the final node.
+
+        Each move is a pair of empty block position before
+        and after the action taken, so only the two swapped
+        tiles need to be updated.
+
+        Args:
+            final (Puzzle): Solution node puzzle.
+
+        Yields:
+            tuple[tuple[int,int],tuple[int,int]]: Empty block position before and after move.
+        """
+        nodes = []
+        while final is not None:
+            nodes.append(final)
+            final = final.parent
+        nodes.reverse()
+        for i in range(1, len(nodes)):
+            yield (nodes[i-1].get_center(), nodes[i].get_center())
+
     def describe(self, show_solution=False) -> str:
         """Return string representation of this solver.
 
@@ -1,9 +1,8 @@
 import os
 from tkinter import NORMAL, DISABLED, ttk, messagebox, Tk, StringVar, IntVar
-from typing import List
+from typing import List, Tuple
 
 from FifteenPuzzleSolver.solver import Solver
-from src.FifteenPuzzleSolver.puzzle import Puzzle
 
 
 class Visualizer(Tk):
@@ -29,7 +28,7 @@ class Visualizer(Tk):
         btn_apply = ttk.Button(frame1, text="Load", command=self.apply)
         btn_apply.grid(row=0, column=3)
         # btn solve
-        self.btn_solve = ttk.Button(frame1, text="Solve", command=self.solve)
+        self.btn_solve = ttk.Button(frame1, text="Solve", command=self.toggle)
         self.btn_solve.grid(row=1, column=0, columnspan=3, sticky="ew")
         self.btn_solve.config(state=DISABLED)
         # btn reset
@@ -50,6 +49,26 @@ class Visualizer(Tk):
         # slider value label
         slider_val_lbl = ttk.Label(frame_slider, text="50ms")
         slider_val_lbl.grid(row=2, column=3, sticky="ew", ipadx=5)
+
+        frame_step = ttk.Frame(self)
+        # btn step back
+        self.btn_prev = ttk.Button(frame_step, text="<", width=3,
+            command=lambda: self.manual(self.step_backward))
+        self.btn_prev.grid(row=0, column=0)
+        # seek slider
+        self.seek_step = IntVar(value=0)
+        self.slider_seek = ttk.Scale(frame_step, from_=0, to=0,
+            variable=self.seek_step, orient="horizontal",
+            command=self.on_seek)
+        self.slider_seek.grid(row=0, column=1, sticky="ew")
+        # btn step forward
+        self.btn_next = ttk.Button(frame_step, text=">", width=3,
+            command=lambda: self.manual(self.step_forward))
+        self.btn_next.grid(row=0, column=2)
+        # step value label
+        self.step_lbl = ttk.Label(frame_step, text="0/0", width=7, anchor="center")
+        self.step_lbl.grid(row=0, column=3, sticky="ew", ipadx=5)
+        self.set_controls(DISABLED)
         
         # create grid frame
         frame2 = ttk.Frame(self, relief="sunken", borderwidth=2)
@@ -76,10 +95,14 @@ class Visualizer(Tk):
         # show frame
         frame1.grid(padx=5, pady=5)
         frame_slider.grid()
+        frame_step.grid()
         frame2.grid(padx=5, pady=5)
 
-        self.after_list = []
+        self.after_id = None
         self.solver = None
+        self.cur_map:List[List[int]] = []
+        self.moves:List[Tuple[Tuple[int,int],Tuple[int,int]]] = []
+        self.step = 0
 
         if solver:
             self.solver = solver
@@ -90,6 +113,7 @@ class Visualizer(Tk):
     def load_solver(self) -> None:
         """Load the solver instance.
         """
+        self.pause()
         messagebox.showinfo("Load","\n".join([
             "Successfully load puzzle!",
             "{}",
@@ -101,12 +125,17 @@ class Visualizer(Tk):
             self.solver.describe()
         ))
         if self.solver.can_solve():
-            self.btn_solve["state"] = NORMAL
+            self.moves = list(Solver.solve_moves(self.solver.final))
             self.btn_reset["state"] = NORMAL
+            self.set_controls(NORMAL)
         else:
-            self.btn_solve["state"] = DISABLED
+            self.moves = []
             self.btn_reset["state"] = DISABLED
+            self.set_controls(DISABLED)
+        self.slider_seek.config(to=len(self.moves))
         self.update(self.solver.root.map_)
+        self.step = 0
+        self.sync_step()
 
     def apply(self) -> None:
         """Apply text in input file.
@@ -123,77 +152,168 @@ class Visualizer(Tk):
             )
 
     def update(self, cur_map) -> None:
-        """Update the grid with map.
+        """Update the whole grid with map.
 
         Args:
             cur_map (list[list[int]]): Map to update.
         """
+        self.cur_map = [ [ cur_map[i][j] for j in range(4) ] for i in range(4) ]
         for i in range(4):
             for j in range(4):
-                g = self.grid_puzzle[i*4+j]
-                if g["text"] == "16": # bring back last tile 16
-                    g.grid(row=i, column=j)
-                if cur_map[i][j] == 16: # hide current tile 16
-                    g.grid_remove()
-                g["text"] = str(cur_map[i][j])
+                self.update_tile((i, j))
 
-    def update_after(self, depth, map):
-        """Update from after coroutine.
+    def update_tile(self, pos) -> None:
+        """Update a single tile in the grid from current map.
 
         Args:
-            depth (int): The depth of this map.
-            map (list[list[int]]): The map to update.
+            pos (tuple[int,int]): The tile position to update.
         """
-        self.update(map)
-        if depth == self.solver.final.depth:
-            # We update gui to normal after reaching solution.
-            self.btn_solve.config(state=NORMAL)
-            self.slider_speed.config(state=NORMAL)
+        g = self.grid_puzzle[pos[0]*4+pos[1]]
+        val = self.cur_map[pos[0]][pos[1]]
+        if val == 16: # hide empty tile
+            g.grid_remove()
+        else:
+            g.grid(row=pos[0], column=pos[1])
+        g["text"] = str(val)
 
-    def traverse(self, depth, cur_state:Puzzle):
-        """Traverse the puzzle in a delay animation.
+    def swap_tile(self, p1, p2) -> None:
+        """Swap two tiles and only redraw both of them.
+
+        Args:
+            p1 (tuple[int,int]): Tile 1 coordinate.
+            p2 (tuple[int,int]): Tile 2 coordinate.
+        """
+        temp = self.cur_map[p1[0]][p1[1]]
+        self.cur_map[p1[0]][p1[1]] = self.cur_map[p2[0]][p2[1]]
+        self.cur_map[p2[0]][p2[1]] = temp
+        self.update_tile(p1)
+        self.update_tile(p2)
 
-        It will continously traverse parent from child
-        first, then update the grid from the parent to
-        child by increasing the delay time as it
-        reaches the final node.
+    def set_controls(self, state) -> None:
+        """Set the state of playback controls.
 
         Args:
-            depth (int): Current depth of the traverse.
-            cur_state (Puzzle): Current puzzle to traverse.
-        """
-        if cur_state.parent is not None:
-            self.traverse(depth-1, cur_state.parent)
-        self.after_list.append(self.after(
-            self.anim_speed.get()*(depth),
-            lambda: self.update_after(depth, cur_state.map_)
-        ))
+            state (str): Either NORMAL or DISABLED.
+        """
+        for btn in (self.btn_solve, self.btn_prev, self.btn_next, self.slider_seek):
+            btn.config(state=state)
 
-    def solve(self) -> None:
-        """Start the solve animation.
+    def sync_step(self) -> None:
+        """Sync the seek slider and step label with current step.
         """
-        # Disable buttons
-        self.btn_solve.config(state=DISABLED)
-        self.slider_speed.config(state=DISABLED)
-        # Stop any after coroutine if available and clear
-        for i in self.after_list:
-            self.after_cancel(i)
-        self.after_list.clear()
-        # Start traversing and animating the solution
-        self.traverse(self.solver.final.depth, self.solver.final)
+        self.seek_step.set(self.step)
+        self.step_lbl.config(text="{}/{}".format(self.step, len(self.moves)))
+
+    def step_forward(self) -> bool:
+        """Apply the next move of the solution.
+
+        Returns:
+            bool: False if already at the final step.
+        """
+        if self.step >= len(self.moves):
+            return False
+        self.swap_tile(*self.moves[self.step])
+        self.step += 1
+        self.sync_step()
+        return True
+
+    def step_backward(self) -> bool:
+        """Undo the last applied move of the solution.
+
+        Returns:
+            bool: False if already at the initial step.
+        """
+        if self.step <= 0:
+            return False
+        self.step -= 1
+        self.swap_tile(*self.moves[self.step])
+        self.sync_step()
+        return True
+
+    def seek(self, step) -> None:
+        """Seek to a step by applying or undoing the moves in between.
+
+        Args:
+            step (int): The step to seek, clamped to the solution length.
+        """
+        step = max(0, min(step, len(self.moves)))
+        while self.step < step:
+            self.step_forward()
+        while self.step > step:
+            self.step_backward()
+
+    def on_seek(self, value) -> None:
+        """Seek slider callback.
+
+        Args:
+            value (str): The slider value.
+        """
+        step = round(float(value))
+        if step != self.step:
+            self.manual(lambda: self.seek(step))
+        else:
+            self.sync_step() # snap slider to the exact step
+
+    def manual(self, action) -> None:
+        """Pause the playback and run a manual step action.
+
+        Args:
+            action (Callable): The step action to run.
+        """
+        self.pause()
+        action()
+
+    def schedule(self) -> None:
+        """Schedule the next playback step with current speed.
+
+        Only one step is scheduled at a time, so speed changes
+        take effect on the next step.
+        """
+        self.after_id = self.after(self.anim_speed.get(), self.play_next)
+
+    def play_next(self) -> None:
+        """Play the next step from after coroutine.
+        """
+        self.after_id = None
+        if self.step_forward() and self.step < len(self.moves):
+            self.schedule()
+        else:
+            # We update gui to normal after reaching solution.
+            self.pause()
+
+    def play(self) -> None:
+        """Start or resume the solve animation.
+        """
+        if self.step >= len(self.moves): # replay from the start
+            self.seek(0)
+        self.btn_solve.config(text="Pause")
+        self.schedule()
+
+    def pause(self) -> None:
+        """Pause the solve animation.
+        """
+        # Stop after coroutine if available
+        if self.after_id is not None:
+            self.after_cancel(self.after_id)
+            self.after_id = None
+        self.btn_solve.config(text="Solve")
+
+    def toggle(self) -> None:
+        """Toggle the solve animation between play and pause.
+        """
+        if self.after_id is None:
+            self.play()
+        else:
+            self.pause()
 
     def reset(self) -> None:
         """Reset the solve animation.
         """
-        # Enable buttons
-        self.btn_solve.config(state=NORMAL)
-        self.slider_speed.config(state=NORMAL)
-        # Stop any after coroutine if available and clear
-        for i in self.after_list:
-            self.after_cancel(i)
-        self.after_list.clear()
+        self.pause()
         # Reset the grid to initial root
         self.update(self.solver.root.map_)
+        self.step = 0
+        self.sync_step()
 
 if __name__ == "__main__":
     v = Visualizer()